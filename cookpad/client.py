@@ -1,21 +1,40 @@
 from __future__ import annotations
 
+import asyncio
+import importlib.util
 import json
+import math
 import uuid
-from typing import Any, Literal
+from typing import Any, Iterable, Literal
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+from .cache import TTLCache
 from .constants import (
     API_HOST,
     BASE_URL,
+    DEFAULT_CACHE_SIZE,
+    DEFAULT_CACHE_TTL,
     DEFAULT_COUNTRY,
     DEFAULT_LANGUAGE,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    DEFAULT_MAX_RETRIES,
     DEFAULT_PROVIDER_ID,
+    DEFAULT_TIMEOUT,
     DEFAULT_TIMEZONE_ID,
     DEFAULT_TIMEZONE_OFFSET,
     DEFAULT_TOKEN,
     DEFAULT_USER_AGENT,
+    MAX_RETRY_DELAY,
+    RETRY_BACKOFF_BASE,
+    RETRY_STATUS_CODES,
     SUPPORTED_SEARCH_TYPES,
 )
 from .exceptions import (
@@ -24,6 +43,7 @@ from .exceptions import (
     NotFoundError,
     RateLimitError,
 )
+from .throttle import AIMDLimiter
 from .types import (
     CommentsResponse,
     Recipe,
@@ -35,6 +55,38 @@ from .types import (
     parse_users_response,
 )
 
+# HTTP/2 needs the optional ``h2`` package (``pip install httpx[http2]``).
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _loads(content: bytes) -> Any:
+    # Parse the raw bytes directly; both parsers detect UTF-8 themselves,
+    # so httpx's charset sniffing and str decode are skipped.
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _backoff_delay(attempt: int) -> float:
+    return min(RETRY_BACKOFF_BASE * 2**attempt, MAX_RETRY_DELAY)
+
+
+def _retry_delay(resp: httpx.Response, attempt: int) -> float | None:
+    """Honour a numeric Retry-After header, else back off exponentially.
+
+    Returns ``None`` when the server asks for a longer wait than
+    ``MAX_RETRY_DELAY``; retrying earlier would only be throttled again.
+    """
+    try:
+        retry_after = float(resp.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return _backoff_delay(attempt)
+    if not math.isfinite(retry_after) or retry_after < 0:
+        return _backoff_delay(attempt)
+    if retry_after > MAX_RETRY_DELAY:
+        return None
+    return retry_after
+
 
 class Cookpad:
     """Cookpad API async client.
@@ -45,6 +97,11 @@ class Cookpad:
             results = await client.search_recipes("カレー")
             for recipe in results.recipes:
                 print(recipe.title)
+
+    ``async with`` is optional: the HTTP client is created on the first
+    request and reused until :meth:`aclose` (or the end of the ``async with``
+    block) closes it. With ``close_on_exit=False`` leaving the block keeps
+    the connection pool open for the next one; call :meth:`aclose` when done.
     """
 
     def __init__(
@@ -57,49 +114,114 @@ class Cookpad:
         timezone_offset: str = DEFAULT_TIMEZONE_OFFSET,
         user_agent: str = DEFAULT_USER_AGENT,
         provider_id: str = DEFAULT_PROVIDER_ID,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        close_on_exit: bool = True,
     ) -> None:
-        self._token = token
-        self._country = country
-        self._language = language
-        self._timezone_id = timezone_id
-        self._timezone_offset = timezone_offset
-        self._user_agent = user_agent
-        self._provider_id = provider_id
+        if max_retries < 0:
+            raise ValueError("max_retries must be >= 0")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        # Everything except X-Cookpad-Guid is fixed for the client's lifetime.
+        self._static_headers = {
+            "Host": API_HOST,
+            "Authorization": f"Bearer {token}",
+            "X-Cookpad-Country-Selected": country,
+            "X-Cookpad-Timezone-Id": timezone_id,
+            "X-Cookpad-Provider-Id": provider_id,
+            "X-Cookpad-Timezone-Offset": timezone_offset,
+            "Accept-Encoding": "gzip",
+            "Accept-Language": language,
+            "Accept": "*/*",
+            "User-Agent": user_agent,
+        }
+        self._limits = httpx.Limits(
+            max_connections=DEFAULT_MAX_CONNECTIONS,
+            max_keepalive_connections=DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        )
+        self._timeout = httpx.Timeout(DEFAULT_TIMEOUT)
         self._client: httpx.AsyncClient | None = None
+        self._cache = TTLCache(cache_size, cache_ttl)
+        self._max_retries = max_retries
+        self._limiter = AIMDLimiter(max_concurrency)
+        self._close_on_exit = close_on_exit
 
     async def __aenter__(self) -> Cookpad:
-        self._client = httpx.AsyncClient()
         return self
 
     async def __aexit__(self, *args: Any) -> None:
+        if self._close_on_exit:
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connections.
+
+        The client can still be used afterwards; a new connection pool is
+        opened on the next request.
+        """
         if self._client:
             await self._client.aclose()
             self._client = None
 
-    def _headers(self) -> dict[str, str]:
-        return {
-            "Host": API_HOST,
-            "Authorization": f"Bearer {self._token}",
-            "X-Cookpad-Country-Selected": self._country,
-            "X-Cookpad-Timezone-Id": self._timezone_id,
-            "X-Cookpad-Provider-Id": self._provider_id,
-            "X-Cookpad-Timezone-Offset": self._timezone_offset,
-            "X-Cookpad-Guid": str(uuid.uuid4()).upper(),
-            "Accept-Encoding": "gzip",
-            "Accept-Language": self._language,
-            "Accept": "*/*",
-            "User-Agent": self._user_agent,
-        }
+    def _ensure_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=BASE_URL,
+                http2=_HTTP2_AVAILABLE,
+                limits=self._limits,
+                timeout=self._timeout,
+                headers=self._static_headers,
+            )
+        return self._client
+
+    def _per_request_headers(self) -> dict[str, str]:
+        return {"X-Cookpad-Guid": str(uuid.uuid4()).upper()}
+
+    def clear_cache(self) -> None:
+        """Drop all cached responses."""
+        self._cache.clear()
 
     async def _request(
-        self, path: str, params: dict[str, Any] | None = None
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        *,
+        cache: bool = False,
     ) -> dict[str, Any]:
-        if self._client is None:
-            self._client = httpx.AsyncClient()
+        if cache:
+            key = (path, tuple(sorted(params.items())) if params else ())
+            # Raw bytes are cached and parsed per hit, so every caller gets
+            # its own dict and cached entries stay compact.
+            if (cached := self._cache.get(key)) is not None:
+                return _loads(cached)
 
-        resp = await self._client.get(
-            f"{BASE_URL}{path}", headers=self._headers(), params=params
-        )
+        client = self._ensure_client()
+        for attempt in range(self._max_retries + 1):
+            try:
+                async with self._limiter as generation:
+                    resp = await client.get(
+                        path, headers=self._per_request_headers(), params=params
+                    )
+            except (httpx.NetworkError, httpx.RemoteProtocolError):
+                if attempt == self._max_retries:
+                    raise
+                await asyncio.sleep(_backoff_delay(attempt))
+                continue
+
+            if resp.status_code not in RETRY_STATUS_CODES:
+                self._limiter.on_success()
+                break
+            # Only an explicit rate limit shrinks concurrency; 5xx and
+            # network errors are retried without treating them as congestion.
+            if resp.status_code == 429:
+                self._limiter.on_throttle(generation)
+            if attempt == self._max_retries:
+                break
+            if (delay := _retry_delay(resp, attempt)) is None:
+                break
+            await asyncio.sleep(delay)
 
         if resp.status_code == 401:
             raise AuthenticationError("Authentication failed")
@@ -112,7 +234,9 @@ class Cookpad:
                 f"API error ({resp.status_code}): {resp.text}", resp.status_code
             )
 
-        return resp.json()
+        if cache:
+            self._cache.set(key, resp.content)
+        return _loads(resp.content)
 
     # --- Recipe search ---
 
@@ -128,33 +252,84 @@ class Cookpad:
         must_have_photo_in_steps: bool = False,
         included_ingredients: str = "",
         excluded_ingredients: str = "",
+        include_raw: bool = False,
     ) -> SearchResponse:
-        """Search recipes by keyword."""
+        """Search recipes by keyword.
+
+        The raw API response is kept in ``SearchResponse.raw`` only when
+        ``include_raw`` is true.
+        """
         params: dict[str, Any] = {
             "query": query,
             "page": page,
             "per_page": per_page,
             "order": order,
-            "must_have_cooksnaps": str(must_have_cooksnaps).lower(),
-            "minimum_number_of_cooksnaps": minimum_cooksnaps,
-            "must_have_photo_in_steps": str(must_have_photo_in_steps).lower(),
             "from_delicious_ways": "false",
             "search_source": "recipe.search.typed_query",
             "supported_types": SUPPORTED_SEARCH_TYPES,
         }
+        # Filters are only sent when set; the API defaults to false / 0.
+        if must_have_cooksnaps:
+            params["must_have_cooksnaps"] = "true"
+        if minimum_cooksnaps:
+            params["minimum_number_of_cooksnaps"] = minimum_cooksnaps
+        if must_have_photo_in_steps:
+            params["must_have_photo_in_steps"] = "true"
         if included_ingredients:
             params["included_ingredients"] = included_ingredients
         if excluded_ingredients:
             params["excluded_ingredients"] = excluded_ingredients
 
-        data = await self._request("/search_results", params)
-        return parse_search_response(data)
+        # "recent" results change constantly, so only other orders are cached.
+        data = await self._request(
+            "/search_results", params, cache=order != "recent"
+        )
+        return parse_search_response(data, include_raw=include_raw)
+
+    async def search_recipes_pages(
+        self,
+        query: str,
+        *,
+        pages: Iterable[int],
+        per_page: int = 30,
+        order: Literal["recent", "popular", "date"] = "recent",
+        must_have_cooksnaps: bool = False,
+        minimum_cooksnaps: int = 0,
+        must_have_photo_in_steps: bool = False,
+        included_ingredients: str = "",
+        excluded_ingredients: str = "",
+        include_raw: bool = False,
+    ) -> list[SearchResponse]:
+        """Fetch several search result pages concurrently.
+
+        Takes the same filters as :meth:`search_recipes` and returns the
+        responses in the order of ``pages``.
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.search_recipes(
+                        query,
+                        page=page,
+                        per_page=per_page,
+                        order=order,
+                        must_have_cooksnaps=must_have_cooksnaps,
+                        minimum_cooksnaps=minimum_cooksnaps,
+                        must_have_photo_in_steps=must_have_photo_in_steps,
+                        included_ingredients=included_ingredients,
+                        excluded_ingredients=excluded_ingredients,
+                        include_raw=include_raw,
+                    )
+                    for page in pages
+                )
+            )
+        )
 
     # --- Recipe detail ---
 
     async def get_recipe(self, recipe_id: int) -> Recipe:
         """Get full recipe detail by ID."""
-        data = await self._request(f"/recipes/{recipe_id}")
+        data = await self._request(f"/recipes/{recipe_id}", cache=True)
         return parse_recipe(data["result"])
 
     # --- Similar recipes ---
@@ -170,6 +345,7 @@ class Cookpad:
         data = await self._request(
             f"/recipes/{recipe_id}/similar_recipes",
             {"page": page, "per_page": per_page},
+            cache=True,
         )
         return [parse_recipe(r) for r in data.get("result", [])]
 
@@ -210,7 +386,9 @@ class Cookpad:
 
     async def search_keywords(self, query: str = "") -> dict[str, Any]:
         """Get search keyword suggestions."""
-        data = await self._request("/search_keywords", {"query": query})
+        data = await self._request(
+            "/search_keywords", {"query": query}, cache=True
+        )
         return data.get("result", {})
 
     # --- Search history ---
@@ -219,7 +397,10 @@ class Cookpad:
         self, local_history: list[str] | None = None
     ) -> dict[str, Any]:
         """Get search history / trending keywords."""
-        history = json.dumps(local_history or [])
+        if orjson is not None:
+            history = orjson.dumps(local_history or []).decode()
+        else:
+            history = json.dumps(local_history or [])
         data = await self._request(
             "/search_history", {"local_search_history": history}
         )
@@ -11,7 +11,20 @@ DEFAULT_TIMEZONE_ID = "Asia/Tokyo"
 DEFAULT_TIMEZONE_OFFSET = "+09:00"
 DEFAULT_PROVIDER_ID = "8"
 
-SUPPORTED_SEARCH_TYPES = ",".join([
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+
+DEFAULT_CACHE_SIZE = 256
+DEFAULT_CACHE_TTL = 120.0
+
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_MAX_CONCURRENCY = 20
+RETRY_STATUS_CODES = frozenset({429, 502, 503})
+RETRY_BACKOFF_BASE = 0.5
+MAX_RETRY_DELAY = 30.0
+
+SUPPORTED_SEARCH_TYPES = ",".join((
     "search_results/recipe",
     "search_results/visual_guides",
     "search_results/spelling_suggestion",
@@ -23,4 +36,4 @@ SUPPORTED_SEARCH_TYPES = ",".join([
     "search_results/delicious_ways",
     "search_results/popular_promo_recipe",
     "search_results/premium_banner",
-])
+))
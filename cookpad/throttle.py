@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import Any
+
+
+class AIMDLimiter:
+    """Concurrency limiter with additive-increase / multiplicative-decrease.
+
+    Every successful request raises the limit by ``increase`` (up to
+    ``max_limit``); a throttled one multiplies it by ``decrease`` (down to
+    ``min_limit``). Use as ``async with limiter as generation: ...`` and pass
+    ``generation`` to :meth:`on_throttle`, so a burst of requests throttled
+    together only shrinks the limit once.
+    """
+
+    def __init__(
+        self,
+        max_limit: float,
+        *,
+        min_limit: float = 1.0,
+        increase: float = 0.5,
+        decrease: float = 0.5,
+    ) -> None:
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.increase = increase
+        self.decrease = decrease
+        self.limit = max_limit
+        self._in_flight = 0
+        self._generation = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def __aenter__(self) -> int:
+        while self._in_flight >= int(self.limit):
+            # Futures are created per wait on the running loop, so the
+            # limiter is not tied to any one event loop.
+            fut = asyncio.get_running_loop().create_future()
+            self._waiters.append(fut)
+            try:
+                await fut
+            except asyncio.CancelledError:
+                # Pass on a wake-up this task can no longer use.
+                if fut.done() and not fut.cancelled():
+                    self._wake()
+                raise
+            finally:
+                if fut in self._waiters:
+                    self._waiters.remove(fut)
+        self._in_flight += 1
+        return self._generation
+
+    async def __aexit__(self, *args: Any) -> None:
+        # No awaits here: a cancelled request must still release its slot.
+        self._in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        free = int(self.limit) - self._in_flight
+        for fut in self._waiters:
+            if free <= 0:
+                break
+            if not fut.done():
+                fut.set_result(None)
+                free -= 1
+
+    def on_success(self) -> None:
+        self.limit = min(self.max_limit, self.limit + self.increase)
+        self._wake()
+
+    def on_throttle(self, generation: int) -> None:
+        """Shrink the limit, once per batch of requests started together.
+
+        Throttle signals from requests that started before the last decrease
+        are ignored; they describe congestion that was already acted on.
+        """
+        if generation != self._generation:
+            return
+        self._generation += 1
+        self.limit = max(self.min_limit, self.limit * self.decrease)
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Image:
     url: str
     id: str = ""
@@ -12,7 +13,7 @@ class Image:
     alt_text: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Ingredient:
     name: str
     quantity: str
@@ -21,14 +22,14 @@ class Ingredient:
     sanitized_name: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Step:
     description: str
     id: int = 0
     image_url: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     id: int
     name: str
@@ -41,7 +42,7 @@ class User:
     href: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Recipe:
     id: int
     title: str
@@ -66,7 +67,7 @@ class Recipe:
     premium: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Comment:
     id: int
     body: str
@@ -79,7 +80,7 @@ class Comment:
     replies_count: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResponse:
     recipes: list[Recipe]
     total_count: int = 0
@@ -87,13 +88,13 @@ class SearchResponse:
     raw: dict[str, Any] = field(default_factory=dict, repr=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class CommentsResponse:
     comments: list[Comment]
     next_cursor: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UsersResponse:
     users: list[User]
     total_count: int = 0
@@ -102,6 +103,8 @@ class UsersResponse:
 
 # --- パーサー ---
 
+RECIPE_TYPE = sys.intern("search_results/recipe")
+
 
 def parse_image(data: dict[str, Any]) -> Image:
     return Image(
@@ -123,14 +126,15 @@ def parse_ingredient(data: dict[str, Any]) -> Ingredient:
 
 
 def parse_step(data: dict[str, Any]) -> Step:
-    image_url = None
-    for att in data.get("attachments", []):
-        if "url" in att:
-            image_url = att["url"]
-            break
-        if img := att.get("image"):
-            image_url = img.get("url")
-            break
+    # First attachment carrying an image: either a direct "url" or a nested "image"
+    image_url = next(
+        (
+            att["url"] if "url" in att else att["image"].get("url")
+            for att in data.get("attachments", ())
+            if "url" in att or att.get("image")
+        ),
+        None,
+    )
     return Step(
         description=data.get("description", ""),
         id=data.get("id", 0),
@@ -145,7 +149,7 @@ def parse_user(data: dict[str, Any]) -> User:
     return User(
         id=data.get("id", 0),
         name=data.get("name", ""),
-        profile_message=data.get("profile_message", "") or "",
+        profile_message=data.get("profile_message") or "",
         image_url=image_url,
         recipe_count=data.get("recipe_count", 0),
         follower_count=data.get("follower_count", 0),
@@ -164,14 +168,14 @@ def parse_recipe(data: dict[str, Any]) -> Recipe:
     if user_data := data.get("user"):
         user = parse_user(user_data)
 
-    ingredients = [parse_ingredient(i) for i in data.get("ingredients", [])]
-    steps = [parse_step(s) for s in data.get("steps", [])]
+    ingredients = [parse_ingredient(i) for i in data.get("ingredients", ())]
+    steps = [parse_step(s) for s in data.get("steps", ())]
 
     return Recipe(
         id=data.get("id", 0),
         title=data.get("title", ""),
-        story=data.get("story", "") or "",
-        serving=data.get("serving", "") or "",
+        story=data.get("story") or "",
+        serving=data.get("serving") or "",
         cooking_time=data.get("cooking_time"),
         published_at=data.get("published_at", ""),
         hall_of_fame=data.get("hall_of_fame", False),
@@ -179,7 +183,7 @@ def parse_recipe(data: dict[str, Any]) -> Recipe:
         image_url=image_url,
         ingredients=ingredients,
         user=user,
-        advice=data.get("advice", "") or "",
+        advice=data.get("advice") or "",
         bookmarks_count=data.get("bookmarks_count", 0),
         view_count=data.get("view_count", 0),
         comments_count=data.get("comments_count", 0),
@@ -213,11 +217,13 @@ def parse_comment(data: dict[str, Any]) -> Comment:
     )
 
 
-def parse_search_response(data: dict[str, Any]) -> SearchResponse:
+def parse_search_response(
+    data: dict[str, Any], *, include_raw: bool = True
+) -> SearchResponse:
     recipes = [
         parse_recipe(item)
-        for item in data.get("result", [])
-        if item.get("type") == "search_results/recipe"
+        for item in data.get("result", ())
+        if item.get("type") == RECIPE_TYPE
     ]
 
     extra = data.get("extra", {})
@@ -231,7 +237,7 @@ def parse_search_response(data: dict[str, Any]) -> SearchResponse:
         recipes=recipes,
         total_count=total_count,
         next_page=next_page,
-        raw=data,
+        raw=data if include_raw else {},
     )
 
 
@@ -0,0 +1,126 @@
+"""Unit tests for the response cache.
+
+These tests don't hit the API.
+Run with: pytest tests/test_cache.py -v
+"""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from cookpad import Cookpad
+from cookpad import cache as cache_module
+from cookpad.cache import TTLCache
+
+
+def test_get_missing():
+    cache = TTLCache(maxsize=2, ttl=60)
+    assert cache.get("missing") is None
+
+
+def test_set_and_get():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", {"result": 1})
+    assert cache.get("a") == {"result": 1}
+
+
+def test_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_expires_after_ttl(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now)
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    now += 59
+    assert cache.get("a") == 1
+    now += 1
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_zero_maxsize_disables():
+    cache = TTLCache(maxsize=0, ttl=60)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+
+
+def test_clear():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.clear()
+    assert len(cache) == 0
+
+
+# --- Cookpad response cache ---
+
+
+def make_client(**kwargs) -> tuple[Cookpad, list[httpx.Request]]:
+    requests: list[httpx.Request] = []
+
+    def handler(request):
+        requests.append(request)
+        if request.url.path == "/search_results":
+            return httpx.Response(200, json={"result": [], "extra": {}})
+        return httpx.Response(200, json={"result": {"k": [1]}})
+
+    cookpad = Cookpad(**kwargs)
+    cookpad._client = httpx.AsyncClient(
+        base_url="https://example.com", transport=httpx.MockTransport(handler)
+    )
+    return cookpad, requests
+
+
+@pytest.mark.asyncio
+async def test_cached_response_is_not_shared():
+    cookpad, requests = make_client()
+    first = await cookpad.search_keywords("x")
+    first["k"].append("poison")
+    first["new"] = 1
+    second = await cookpad.search_keywords("x")
+    assert second == {"k": [1]}
+    assert len(requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_recent_search_bypasses_cache():
+    cookpad, requests = make_client()
+    await cookpad.search_recipes("x", order="recent")
+    await cookpad.search_recipes("x", order="recent")
+    assert len(requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_popular_search_is_cached():
+    cookpad, requests = make_client()
+    await cookpad.search_recipes("x", order="popular")
+    await cookpad.search_recipes("x", order="popular")
+    assert len(requests) == 1
+    await cookpad.search_recipes("x", order="popular", page=2)
+    assert len(requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_size_zero_disables_cache():
+    cookpad, requests = make_client(cache_size=0)
+    await cookpad.search_keywords("x")
+    await cookpad.search_keywords("x")
+    assert len(requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_clear_cache_forces_refetch():
+    cookpad, requests = make_client()
+    await cookpad.search_keywords("x")
+    cookpad.clear_cache()
+    await cookpad.search_keywords("x")
+    assert len(requests) == 2
@@ -81,13 +81,30 @@ async def test_search_recipes_pagination(client: Cookpad):
     assert ids1 != ids2
 
 
+@pytest.mark.asyncio
+async def test_search_recipes_pages(client: Cookpad):
+    pages = await client.search_recipes_pages("サラダ", pages=[1, 2], per_page=5)
+    assert len(pages) == 2
+    assert all(isinstance(p, SearchResponse) for p in pages)
+    assert pages[0].next_page == 2
+    ids1 = {r.id for r in pages[0].recipes}
+    ids2 = {r.id for r in pages[1].recipes}
+    assert ids1 != ids2
+
+
 @pytest.mark.asyncio
 async def test_search_recipes_raw_access(client: Cookpad):
-    results = await client.search_recipes("ラーメン", per_page=1)
+    results = await client.search_recipes("ラーメン", per_page=1, include_raw=True)
     assert "result" in results.raw
     assert "extra" in results.raw
 
 
+@pytest.mark.asyncio
+async def test_search_recipes_raw_omitted_by_default(client: Cookpad):
+    results = await client.search_recipes("ラーメン", per_page=1)
+    assert results.raw == {}
+
+
 # --- get_recipe ---
 
 
@@ -246,3 +263,4 @@ async def test_without_context_manager():
     client = Cookpad()
     results = await client.search_recipes("test", per_page=1)
     assert isinstance(results, SearchResponse)
+    await client.aclose()
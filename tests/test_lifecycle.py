@@ -0,0 +1,74 @@
+"""Unit tests for the HTTP client lifecycle.
+
+These tests don't hit the API - requests go through httpx.MockTransport.
+Run with: pytest tests/test_lifecycle.py -v
+"""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from cookpad import Cookpad
+from cookpad import client as client_module
+
+
+@pytest.fixture(autouse=True)
+def mock_transport(monkeypatch):
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, json={"result": {}})
+    )
+    async_client = httpx.AsyncClient
+
+    def make_async_client(**kwargs):
+        return async_client(transport=transport, **kwargs)
+
+    monkeypatch.setattr(client_module.httpx, "AsyncClient", make_async_client)
+
+
+@pytest.mark.asyncio
+async def test_client_created_lazily():
+    cookpad = Cookpad()
+    async with cookpad:
+        assert cookpad._client is None
+        await cookpad.search_keywords("x")
+        assert cookpad._client is not None
+
+
+@pytest.mark.asyncio
+async def test_exit_closes_by_default():
+    cookpad = Cookpad()
+    async with cookpad:
+        await cookpad.search_keywords("x")
+        first = cookpad._client
+    assert cookpad._client is None
+    assert first.is_closed
+    async with cookpad:
+        await cookpad.search_keywords("y")
+        assert cookpad._client is not first
+
+
+@pytest.mark.asyncio
+async def test_client_survives_with_blocks_without_close_on_exit():
+    cookpad = Cookpad(close_on_exit=False)
+    async with cookpad:
+        await cookpad.search_keywords("x")
+        first = cookpad._client
+    async with cookpad:
+        await cookpad.search_keywords("y")
+        assert cookpad._client is first
+    assert not first.is_closed
+    await cookpad.aclose()
+    assert first.is_closed
+
+
+@pytest.mark.asyncio
+async def test_usable_after_aclose():
+    cookpad = Cookpad()
+    await cookpad.search_keywords("x")
+    first = cookpad._client
+    await cookpad.aclose()
+    assert cookpad._client is None
+    assert await cookpad.search_keywords("y") == {}
+    assert cookpad._client is not first
+    await cookpad.aclose()
@@ -0,0 +1,76 @@
+"""Unit tests for concurrent search pagination.
+
+These tests don't hit the API - requests go through httpx.MockTransport.
+Run with: pytest tests/test_pages.py -v
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from cookpad import Cookpad
+
+
+def make_client(handler, **kwargs) -> Cookpad:
+    cookpad = Cookpad(**kwargs)
+    cookpad._client = httpx.AsyncClient(
+        base_url="https://example.com", transport=httpx.MockTransport(handler)
+    )
+    return cookpad
+
+
+@pytest.mark.asyncio
+async def test_search_recipes_pages_concurrent_and_ordered():
+    pages = [1, 2, 3, 4]
+    arrived: list[int] = []
+    all_in_flight = asyncio.Event()
+    finished: list[int] = []
+
+    async def handler(request):
+        page = int(request.url.params["page"])
+        arrived.append(page)
+        if len(arrived) == len(pages):
+            all_in_flight.set()
+        await asyncio.wait_for(all_in_flight.wait(), timeout=1)
+        # Earlier pages answer last.
+        await asyncio.sleep(0.01 * (len(pages) - page))
+        finished.append(page)
+        return httpx.Response(
+            200,
+            json={
+                "result": [{"type": "search_results/recipe", "id": page}],
+                "extra": {"total_count": 4},
+            },
+        )
+
+    cookpad = make_client(handler)
+    results = await cookpad.search_recipes_pages("x", pages=pages, order="popular")
+    assert finished == [4, 3, 2, 1]
+    assert [r.recipes[0].id for r in results] == pages
+
+
+@pytest.mark.asyncio
+async def test_search_recipes_pages_forwards_filters():
+    seen: list[httpx.QueryParams] = []
+
+    def handler(request):
+        seen.append(request.url.params)
+        return httpx.Response(200, json={"result": [], "extra": {}})
+
+    cookpad = make_client(handler)
+    await cookpad.search_recipes_pages(
+        "x", pages=[1, 2], per_page=5, must_have_cooksnaps=True
+    )
+    assert sorted(p["page"] for p in seen) == ["1", "2"]
+    assert all(p["per_page"] == "5" for p in seen)
+    assert all(p["must_have_cooksnaps"] == "true" for p in seen)
+
+
+@pytest.mark.asyncio
+async def test_search_recipes_pages_rejects_unknown_filter():
+    cookpad = Cookpad()
+    with pytest.raises(TypeError):
+        await cookpad.search_recipes_pages("x", pages=[1], must_have_cooksnap=True)
@@ -0,0 +1,245 @@
+"""Unit tests for retry/backoff and the AIMD concurrency limiter.
+
+These tests don't hit the API - requests go through httpx.MockTransport.
+Run with: pytest tests/test_throttle.py -v
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from cookpad import Cookpad, RateLimitError
+from cookpad import client as client_module
+from cookpad.throttle import AIMDLimiter
+
+
+def make_client(handler, **kwargs) -> Cookpad:
+    cookpad = Cookpad(**kwargs)
+    cookpad._client = httpx.AsyncClient(
+        base_url="https://example.com", transport=httpx.MockTransport(handler)
+    )
+    return cookpad
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(client_module.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+# --- AIMDLimiter ---
+
+
+def test_limiter_decrease_and_increase():
+    limiter = AIMDLimiter(8)
+    limiter.on_throttle(0)
+    assert limiter.limit == 4
+    limiter.on_success()
+    assert limiter.limit == 4.5
+    for _ in range(20):
+        limiter.on_success()
+    assert limiter.limit == 8
+
+
+def test_limiter_floor():
+    limiter = AIMDLimiter(2)
+    for generation in range(5):
+        limiter.on_throttle(generation)
+    assert limiter.limit == 1
+
+
+def test_limiter_decreases_once_per_generation():
+    limiter = AIMDLimiter(8)
+    for _ in range(5):
+        limiter.on_throttle(0)
+    assert limiter.limit == 4
+    limiter.on_throttle(1)
+    assert limiter.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_limiter_bounds_concurrency():
+    limiter = AIMDLimiter(2)
+    peak = 0
+
+    async def work():
+        nonlocal peak
+        async with limiter:
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0)
+
+    await asyncio.gather(*(work() for _ in range(10)))
+    assert peak == 2
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_limiter_release_never_suspends():
+    # A release that awaits can be cancelled half-way and leak its slot.
+    limiter = AIMDLimiter(1)
+    await limiter.__aenter__()
+    with pytest.raises(StopIteration):
+        limiter.__aexit__(None, None, None).send(None)
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_limiter_cancelled_waiter_passes_slot_on():
+    limiter = AIMDLimiter(1)
+    entered: list[int] = []
+
+    async def waiter(n):
+        async with limiter:
+            entered.append(n)
+
+    async with limiter:
+        tasks = [asyncio.create_task(waiter(n)) for n in range(2)]
+        await asyncio.sleep(0)
+    # The first waiter has just been woken; cancel it before it runs.
+    tasks[0].cancel()
+    await asyncio.wait_for(asyncio.gather(*tasks, return_exceptions=True), 1)
+    assert entered == [1]
+    assert limiter.in_flight == 0
+
+
+def test_limiter_reused_across_event_loops():
+    limiter = AIMDLimiter(1)
+
+    async def work():
+        async with limiter:
+            await asyncio.sleep(0)
+
+    async def burst():
+        await asyncio.gather(*(work() for _ in range(3)))
+
+    asyncio.run(burst())
+    asyncio.run(burst())
+    assert limiter.in_flight == 0
+
+
+# --- _request retries ---
+
+
+@pytest.mark.asyncio
+async def test_retry_after_then_success(sleeps):
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "2"}),
+        httpx.Response(200, json={"result": {"id": 1, "title": "R"}}),
+    ]
+    cookpad = make_client(lambda request: responses.pop(0))
+    recipe = await cookpad.get_recipe(1)
+    assert recipe.title == "R"
+    assert sleeps == [2.0]
+
+
+@pytest.mark.asyncio
+async def test_retry_after_beyond_cap_raises_immediately(sleeps):
+    calls = 0
+
+    def handler(request):
+        nonlocal calls
+        calls += 1
+        return httpx.Response(429, headers={"Retry-After": "120"})
+
+    cookpad = make_client(handler)
+    with pytest.raises(RateLimitError):
+        await cookpad.get_recipe(1)
+    assert calls == 1
+    assert sleeps == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("value", ["nan", "inf", "-5", "soon"])
+async def test_unusable_retry_after_falls_back_to_backoff(sleeps, value):
+    responses = [
+        httpx.Response(429, headers={"Retry-After": value}),
+        httpx.Response(200, json={}),
+    ]
+    cookpad = make_client(lambda request: responses.pop(0))
+    assert await cookpad.search_keywords("x") == {}
+    assert sleeps == [0.5]
+
+
+@pytest.mark.asyncio
+async def test_exponential_backoff_without_retry_after(sleeps):
+    responses = [httpx.Response(502), httpx.Response(503), httpx.Response(200, json={})]
+    cookpad = make_client(lambda request: responses.pop(0))
+    assert await cookpad.search_keywords("x") == {}
+    assert sleeps == [0.5, 1.0]
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_error_after_retries(sleeps):
+    calls = 0
+
+    def handler(request):
+        nonlocal calls
+        calls += 1
+        return httpx.Response(429)
+
+    cookpad = make_client(handler, max_retries=2)
+    with pytest.raises(RateLimitError):
+        await cookpad.get_recipe(1)
+    assert calls == 3
+    assert cookpad._limiter.limit < cookpad._limiter.max_limit
+
+
+@pytest.mark.asyncio
+async def test_retry_on_network_error(sleeps):
+    calls = 0
+
+    def handler(request):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise httpx.ReadError("connection reset", request=request)
+        return httpx.Response(200, json={"result": {}})
+
+    cookpad = make_client(handler)
+    assert await cookpad.search_keywords("x") == {}
+    assert calls == 2
+    assert sleeps == [0.5]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_429s_decrease_limit_once():
+    n = 20
+    arrived = 0
+    all_in_flight = asyncio.Event()
+
+    async def handler(request):
+        nonlocal arrived
+        arrived += 1
+        if arrived == n:
+            all_in_flight.set()
+        await asyncio.wait_for(all_in_flight.wait(), timeout=1)
+        return httpx.Response(429)
+
+    cookpad = make_client(handler, max_retries=0, max_concurrency=n)
+    results = await asyncio.gather(
+        *(cookpad.search_keywords(str(i)) for i in range(n)), return_exceptions=True
+    )
+    assert all(isinstance(r, RateLimitError) for r in results)
+    assert cookpad._limiter.limit == n / 2
+
+
+@pytest.mark.asyncio
+async def test_server_errors_do_not_decrease_limit(sleeps):
+    responses = [httpx.Response(502), httpx.Response(200, json={})]
+    cookpad = make_client(lambda request: responses.pop(0))
+    await cookpad.search_keywords("x")
+    assert cookpad._limiter.limit == cookpad._limiter.max_limit
+
+
+@pytest.mark.parametrize("kwargs", [{"max_retries": -1}, {"max_concurrency": 0}])
+def test_invalid_retry_settings(kwargs):
+    with pytest.raises(ValueError):
+        Cookpad(**kwargs)
@@ -90,6 +90,19 @@ def test_parse_step_with_image():
     assert step.image_url == "https://example.com/step.jpg"
 
 
+def test_parse_step_with_direct_url():
+    data = {
+        "description": "Serve.",
+        "attachments": [
+            {"image": None},
+            {"url": "https://example.com/direct.jpg"},
+            {"image": {"url": "https://example.com/later.jpg"}},
+        ],
+    }
+    step = parse_step(data)
+    assert step.image_url == "https://example.com/direct.jpg"
+
+
 def test_parse_user():
     data = {
         "type": "user",
@@ -219,6 +232,16 @@ def test_parse_search_response():
     assert resp.raw == data
 
 
+def test_parse_search_response_without_raw():
+    data = {
+        "result": [{"type": "search_results/recipe", "id": 1, "title": "R"}],
+        "extra": {"total_count": 1, "links": {}},
+    }
+    resp = parse_search_response(data, include_raw=False)
+    assert len(resp.recipes) == 1
+    assert resp.raw == {}
+
+
 def test_parse_search_response_empty():
     data = {"result": [], "extra": {"total_count": 0, "links": {}}}
     resp = parse_search_response(data)